@@ -3,6 +3,7 @@
 import os
 import platform
 
+from kivy.clock import Clock
 from kivy.logger import Logger
 from kivy.uix.screenmanager import ScreenManager
 from kivy.core.window import Window
@@ -11,13 +12,7 @@ from kivymd.app import MDApp
 from kivymd.uix.button import MDRaisedButton
 from kivymd.uix.dialog import MDDialog
 
-from widgets.Hotkeys import Hotkeys
-from widgets.CollectionPanel import CollectionPanel
-from widgets.CollectionToolbar import CollectionToolbar
-
 from screens.StartScreen import StartScreen
-from screens.CollectionScreen import CollectionScreen
-from screens.ComparisonScreen import ComparisonScreen
 from screens.AboutScreen import AboutScreen
 
 from api.CollectionManager import CollectionManager
@@ -32,6 +27,11 @@ class ArtyApp(MDApp):
         -------
         load_collection(path)
             Load a collection from a path
+        get_screen(key)
+            Get a screen from its key in SCREENS, creating it on first
+            access if needed
+        request_save()
+            Schedule a save of the current collection
     """
 
     # Global variables
@@ -63,33 +63,25 @@ class ArtyApp(MDApp):
         Window.bind(on_dropfile=self._on_file_drop)
         Window.bind(on_request_close=self._on_request_close)
 
+        # save requests made while one is already pending are merged
+        # into a single write (see request_save)
+        self._save_trigger = Clock.create_trigger(self._save_collection, 0.5)
+
         # Create different screens
         screen_manager = ScreenManager()
 
+        # only the screens reachable from the start screen are created
+        # here. The collection and comparison screens are created the
+        # first time they are needed (see get_screen)
         start_screen      =     StartScreen(name="Start")
-        collection_screen =     CollectionScreen(name='Collection')
-        comparison_screen =     ComparisonScreen(name="Compare")
         about_screen      =     AboutScreen(name="About")
 
-        # add hotkeys manager, we're going to use it only in the
-        # collection screen for now
-        collection_screen.add_widget(Hotkeys())
-
-        # reference important widgets
-        self.GRID       =       collection_screen.ids.grid
-        self.PANEL      =       collection_screen.ids.panel
-        self.TOOLBAR    =       collection_screen.ids.toolbar
-        
         # keep reference to all the screens in the app
         self.SCREENS["START"]      =    start_screen
-        self.SCREENS["COLLECTION"] =    collection_screen
-        self.SCREENS["COMPARE"]    =    comparison_screen
         self.SCREENS["ABOUT"]      =    about_screen
 
         # add the screens to display
         screen_manager.add_widget(start_screen)
-        screen_manager.add_widget(collection_screen)
-        screen_manager.add_widget(comparison_screen)
         screen_manager.add_widget(about_screen)
 
         # select the start screen
@@ -100,7 +92,68 @@ class ArtyApp(MDApp):
 
         # select the screen manager as root of the application
         return screen_manager
-    
+
+
+    def get_screen(self, key):
+        """ Summary
+            -------
+            Get a screen from its key in SCREENS. Screens that are not
+            created at startup are created on first access and added to
+            the ScreenManager.
+
+            Arguments
+            ---------
+            key : str
+                Key of the screen in SCREENS (eg. "COLLECTION")
+
+            Returns
+            -------
+            Screen
+                The requested screen
+        """
+        if key not in self.SCREENS:
+            factories = {
+                "COLLECTION":   self._create_collection_screen,
+                "COMPARE":      self._create_comparison_screen,
+            }
+            screen = factories[key]()
+
+            self.SCREENS[key] = screen
+            self.SCREEN_MANAGER.add_widget(screen)
+
+        return self.SCREENS[key]
+
+
+    def _create_collection_screen(self):
+        """ Creates the collection screen and references its widgets """
+        # imported here so that the screen and its templates are only
+        # loaded once a collection is opened
+        from screens.CollectionScreen import CollectionScreen
+        from widgets.Hotkeys import Hotkeys
+
+        collection_screen = CollectionScreen(name='Collection')
+
+        # add hotkeys manager, we're going to use it only in the
+        # collection screen for now
+        collection_screen.add_widget(Hotkeys())
+
+        # reference important widgets
+        self.GRID       =       collection_screen.ids.grid
+        self.PANEL      =       collection_screen.ids.panel
+        self.TOOLBAR    =       collection_screen.ids.toolbar
+
+        return collection_screen
+
+
+    def _create_comparison_screen(self):
+        """ Creates the comparison screen for the current project """
+        from screens.ComparisonScreen import ComparisonScreen
+
+        comparison_screen = ComparisonScreen(name="Compare")
+        comparison_screen.initialize(self.PROJECT_DIRECTORY)
+
+        return comparison_screen
+
 
     def load_collection(self, path):
         """ Summary
@@ -115,6 +168,11 @@ class ArtyApp(MDApp):
                 Path to the work directory
 
         """
+        # write any pending change to the previous collection before
+        # replacing it
+        if self._save_trigger.is_triggered:
+            self._save_collection()
+
         self.PROJECT_DIRECTORY = path
 
         try:
@@ -135,6 +193,8 @@ class ArtyApp(MDApp):
             Logger.exception(err_msg)
             return
 
+        collection_screen = self.get_screen("COLLECTION")
+
         # give the collection to the CollectionGrid, which will in turn
         # display the images on the screen
         self.GRID.set_collection(self.CURRENT_COLLECTION)
@@ -144,12 +204,14 @@ class ArtyApp(MDApp):
         self.PANEL.initialize(self.PROJECT_DIRECTORY)
         self.PANEL.set_image(self.CURRENT_COLLECTION.get_collection()[0])
 
-        # initialize ComparisonScreen
-        self.SCREENS['COMPARE'].initialize(self.PROJECT_DIRECTORY)
+        # initialize ComparisonScreen, if it was already created.
+        # Otherwise it is initialized on creation.
+        if "COMPARE" in self.SCREENS:
+            self.SCREENS['COMPARE'].initialize(self.PROJECT_DIRECTORY)
 
         # switch to the collection screen
         self.SCREEN_MANAGER.switch_to(
-            self.SCREENS["COLLECTION"], 
+            collection_screen,
             direction="down"
         )
 
@@ -182,7 +244,8 @@ class ArtyApp(MDApp):
                 
         # make it so that one can only drop a file if the current screen
         # is the collection screen
-        if not self.SCREEN_MANAGER.current == self.SCREENS["COLLECTION"].name:
+        collection_screen = self.SCREENS.get("COLLECTION")
+        if not collection_screen or not self.SCREEN_MANAGER.current == collection_screen.name:
             # to localize
             err_msg = "Can only drop files on collection screen."
             self.show_error(err_msg)
@@ -191,9 +254,11 @@ class ArtyApp(MDApp):
 
         try:
             # add image to the collection
-            self.CURRENT_COLLECTION.add_image(file_path)
-            # refresh the CollectionGrid
-            self.GRID.set_collection(self.CURRENT_COLLECTION)
+            new_image = self.CURRENT_COLLECTION.add_image(file_path)
+            # add it to the CollectionGrid, the other tiles are kept
+            self.GRID.append_image(new_image)
+            # save the collection once all the dropped files are added
+            self.request_save()
 
         except ValueError as err:
             err_msg = "The file %s couldn't be added to the collection." % file_path
@@ -219,7 +284,7 @@ class ArtyApp(MDApp):
                 #return True
 
             # save the entire collection to disk.
-            CollectionManager.save(self.CURRENT_COLLECTION)
+            self._save_collection()
 
         return False
 
@@ -231,11 +296,39 @@ class ArtyApp(MDApp):
             Just to be sure, we'll save the collection at that moment.
         """
         Logger.info("Arty is paused.")
-        CollectionManager.save(self.CURRENT_COLLECTION)
+        self._save_collection()
 
         return True
 
 
+    def request_save(self):
+        """ Summary
+            -------
+            Schedule a save of the current collection. Each request
+            postpones the save, so the collection is written to disk
+            once, shortly after the last request (eg. when several files
+            are dropped on the window at once).
+            A save made after add_image copied a file, or after the
+            directory changed outside of the app, makes the next load
+            check the files again (see CollectionManager.save).
+        """
+        # restart the delay instead of keeping the first one
+        self._save_trigger.cancel()
+        self._save_trigger()
+
+
+    def _save_collection(self, *_args):
+        """ Summary
+            -------
+            Save the current collection to disk right away, and cancel
+            any pending save request.
+        """
+        self._save_trigger.cancel()
+
+        if self.CURRENT_COLLECTION:
+            CollectionManager.save(self.CURRENT_COLLECTION)
+
+
     def show_error(self, message):
         if not self.dialog:
             self.dialog = MDDialog(
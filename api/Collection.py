@@ -4,16 +4,18 @@
     -----------------
     Handles the datastructure of a collection
 """
-import ntpath
 import os
 import shutil
 from dataclasses import dataclass, field
-from dataclasses_json import dataclass_json
+from typing import List
+from mashumaro.mixins.orjson import DataClassORJSONMixin
+
+from api.CollectionImage import CollectionImage
+from api.CollectionUtils import AUTHORIZED_IMAGE_FORMATS
 
 
-@dataclass_json
 @dataclass
-class Collection():
+class Collection(DataClassORJSONMixin):
     """
         Summary
         -------
@@ -47,7 +49,7 @@ class Collection():
     # user's disk.
     work_directory :    str
     version :           str
-    collection:         list = field(default_factory=list)
+    collection:         List[CollectionImage] = field(default_factory=list)
 
     def get_collection(self):
         """getter for the collection list"""
@@ -70,21 +72,21 @@ class Collection():
                 The image that was inserted in the collection
         """
 
-        from api.CollectionImage import CollectionImage
-        from api.CollectionUtils import CollectionUtils
-
-        # get the file name, using ntpath
-        file_name = ntpath.basename(source)
+        # get the file name. Dropped paths use the platform's separator,
+        # and os.path is ntpath on Windows anyway
+        file_name = os.path.basename(source)
 
         # check that the file sent is of accepted format
-        if not file_name.lower().endswith(
-            CollectionUtils.AUTHORIZED_IMAGE_FORMATS
-        ):
+        extension = os.path.splitext(file_name)[1].lower()
+        if extension not in AUTHORIZED_IMAGE_FORMATS:
             raise ValueError("Unauthorized file format %s" % file_name)
 
         # copy the file to the working directory
         # NOTE: should verify if the user is not dragging a file from
         # the working directory
+        # copyfile already uses the platform's fast copy (sendfile on
+        # Linux, fcopyfile on macOS, 1MiB chunks on Windows) since
+        # Python 3.8, no need for a custom copy loop for large images.
         try:
             shutil.copyfile(
                 source,
@@ -150,7 +152,6 @@ class Collection():
             absolute_path: str
                 absolute path to the image file
         """
-        from api.CollectionImage import CollectionImage
         if not isinstance(collection_image, CollectionImage):
             raise ValueError(
                 "collection_image must be of type CollectionImage"
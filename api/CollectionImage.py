@@ -1,13 +1,23 @@
 import re
+import sys
 from typing import Optional
 from dataclasses import dataclass
-from dataclasses_json import dataclass_json
+from mashumaro.mixins.orjson import DataClassORJSONMixin
+
+
+# __slots__ can't be declared by hand on a dataclass with default
+# values, and the dataclass decorator only generates them from Python
+# 3.10 onwards.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# tokens of each legend style, in order. Filled on first use of a style
+# so that the style strings are only parsed once.
+_LEGEND_TOKENS = dict()
 
 
 # pylint: disable=too-many-instance-attributes
-@dataclass_json
-@dataclass
-class CollectionImage():
+@dataclass(eq=False, **_SLOTS)
+class CollectionImage(DataClassORJSONMixin):
     """
         Summary
         -------
@@ -92,13 +102,11 @@ class CollectionImage():
             ----------
             [1] https://www.unil.ch/files/live/sites/hart/files/shared/Espace_Etudiants/GPS_Guide_du_proseminaire.pdf
         """
-        from api.CollectionUtils import CollectionUtils
-
         # rules for replacing style tokens
         formatting = {
             "artist": self.artist,
             "title": self.title if self.title else "Untitled",
-            "title_italic": "[i]" + self.title + "[/i]"  if self.title else "[i]Untitled[/i]",
+            "title_italic": f"[i]{self.title}[/i]" if self.title else "[i]Untitled[/i]",
             "datation": self.datation,
             "technique": self.technique,
             "material": self.material,
@@ -108,9 +116,13 @@ class CollectionImage():
             "production_site_if_no_artist": self.production_site if not self.artist else "",
         }
 
-        style = CollectionUtils.LEGEND_STYLES[style_name]
+        tokens = _LEGEND_TOKENS.get(style_name)
+        if tokens is None:
+            from api.CollectionUtils import CollectionUtils
+
+            style = CollectionUtils.LEGEND_STYLES[style_name]
+            tokens = _LEGEND_TOKENS[style_name] = re.findall(r"{(\w+)}", style)
 
-        tokens = [m.group(1) for m in re.finditer(r"{(\w+)}", style)]
         # replace tokens if the formatted value exists, else skip
         formatted_tokens = [formatting[t] for t in tokens if formatting[t]]
 
@@ -124,3 +136,9 @@ class CollectionImage():
             the same filename are considered the same image.
         """
         return self.filename == other.filename
+
+
+    def __hash__(self):
+        """ consistent with __eq__: the filename identifies an image.
+        """
+        return hash(self.filename)
@@ -1,11 +1,12 @@
-import json
 import os
+from collections import OrderedDict
 
+import orjson
 from kivy.logger import Logger
 
 from api.Collection import Collection
 from api.CollectionImage import CollectionImage
-from api.CollectionUtils import CollectionUtils
+from api.CollectionUtils import AUTHORIZED_IMAGE_FORMATS
 
 
 class CollectionManager():
@@ -23,8 +24,8 @@ class CollectionManager():
         TODO
         ----
         - Make loading times faster
-        - JSON format optimisation by minifying and aliasing the property
-          names to take less space on disk.
+        - JSON format optimisation by aliasing the property names to
+          take less space on disk.
         - Proof the loading so:
             1. we can have the absolute path to an image in a
                CollectionImage
@@ -44,12 +45,22 @@ class CollectionManager():
     # in here is the best idea. We should go back to something separate
     # from app versioning.
 
+    # collections recently loaded or saved, the most recent last. Only
+    # filled while the collection is in sync with the files (see
+    # __is_in_sync)
+    # {work directory: (meta file path, meta file mtime, collection)}
+    CACHE_SIZE = 5
+    _cache = OrderedDict()
+
     @classmethod
     def load(cls, path):
         """ Summary
             -------
             This function loads a collection from a path. If there is no
-            collection here, create a new meta file
+            collection here, create a new meta file.
+            If the collection was recently loaded or saved and nothing
+            changed on disk since, the same Collection object is
+            returned.
 
             Parameters
             ----------
@@ -68,27 +79,49 @@ class CollectionManager():
                 if the collection's work directory is not found
 
         """
+        collection = cls.__get_cached(path)
+        if collection is not None:
+            Logger.info("Collection: Collection loaded from cache")
+            return collection
+
+        # list the directory once, the result is shared by all the
+        # steps below
+        with os.scandir(path) as scan:
+            dir_entries = list(scan)
+
         # check if the path given is valid
-        if not os.listdir(path):
+        if not dir_entries:
             raise FileNotFoundError
 
         # check if there is already a project file in this directory
-        meta_filename = cls._get_meta_filename(path)
+        meta_filename = cls._get_meta_filename(
+            path, [entry.name for entry in dir_entries]
+        )
 
         if meta_filename:
             # if it's the case, load it.
-            collection = cls.__load_meta(path)
+            collection = cls.__load_meta(path, meta_filename)
+
+            # if no file was added, removed or renamed since the meta
+            # was written, it is already in sync with the directory
+            if cls.__is_in_sync(path, meta_filename):
+                cls.__cache(collection, os.path.join(path, meta_filename))
+                Logger.info("Collection: Collection loaded")
+                return collection
         else:
             # if it's not the case, create a new one and start with a
             # default collection
-            cls.__create_meta(path)
+            meta_filename = cls.__create_meta(path)
             # create a default collection
             collection = Collection(path, "Untitled Collection", list())
 
         # check the images in the directory and update the collection
         # and meta
-        collection = cls.__check_files(collection)
-        cls.__write_meta(collection)
+        collection = cls.__check_files(collection, dir_entries)
+        # the directory was just checked, so the meta can be marked as
+        # in sync with it
+        meta_file_path = cls.__write_meta(collection, meta_filename, in_sync=True)
+        cls.__cache(collection, meta_file_path)
         Logger.info("Collection: Collection loaded")
 
         return collection
@@ -104,12 +137,28 @@ class CollectionManager():
             collection: Collection
                 the Collection object to save
         """
-        cls.__write_meta(collection)
+        meta_filename = cls._get_meta_filename(collection.work_directory)
+
+        # saving doesn't check the files: the meta only stays marked as
+        # in sync if nothing changed in the directory since the last
+        # check. Any file added, removed or renamed in the meantime
+        # (including by add_image) changes the directory mtime.
+        in_sync = bool(meta_filename) and cls.__is_in_sync(
+            collection.work_directory, meta_filename
+        )
+        meta_file_path = cls.__write_meta(collection, meta_filename, in_sync=in_sync)
+
+        if in_sync:
+            cls.__cache(collection, meta_file_path)
+        else:
+            # the next load() has to check the files again
+            cls._cache.pop(os.path.abspath(collection.work_directory), None)
+
         Logger.info("Collection: Collection saved")
 
 
     @classmethod
-    def fix_version_conflict(cls, json_string):
+    def fix_version_conflict(cls, coll_dict):
         """ Summary
             -------
             Rules for upgrading older versions of a collection's meta
@@ -117,12 +166,15 @@ class CollectionManager():
 
             Arguments
             ---------
-            json_string : str
-                Outdated JSON string collected from the meta file
-        """
-        # turn the JSON into a dictionary for easy modifications
-        coll_dict = json.loads(json_string)
+            coll_dict : dict
+                Outdated collection, as parsed from the meta file. It is
+                upgraded in place.
 
+            Returns
+            -------
+            coll_dict : dict
+                The upgraded collection
+        """
         try:
             version = coll_dict["version"]
         except KeyError:
@@ -167,25 +219,19 @@ class CollectionManager():
             pass
 
 
-        # turn the dictionary back to a JSON string
-        json_string = json.dumps(coll_dict)
-
-        return json_string
+        return coll_dict
 
 
     @classmethod
-    def __load_meta(cls, path):
+    def __load_meta(cls, path, meta_filename):
         """ Summary
             -------
             Deserializes the data from the meta file and updates the
             collection.
         """
         # read the existing meta file
-        meta_filename = cls._get_meta_filename(path)
-
-        with open(os.path.join(path, meta_filename), "r") as meta:
-            coll_json = meta.read()
-            coll_dict = json.loads(coll_json)
+        with open(os.path.join(path, meta_filename), "rb") as meta:
+            coll_dict = orjson.loads(meta.read())
 
         # retrieve the version of the collection
         try:
@@ -199,32 +245,43 @@ class CollectionManager():
                 ) from exc
 
         if version != cls.VERSION:
-            coll_json = cls.fix_version_conflict(coll_json)
-            # reload the fixed json
-            coll_dict = json.loads(coll_json)
+            # upgrade the parsed data directly, no need to go back and
+            # forth between dict and JSON
+            coll_dict = cls.fix_version_conflict(coll_dict)
 
         # now we are sure the data is clean, we can load the collection
 
         version = coll_dict["version"]
 
         # retrieve the collection list
-        collection = [
-            # cast each object in the JSON list to a CollectionImage
-            # pylint: disable=no-member
-            CollectionImage.from_dict(item) for item in coll_dict["collection"]
-        ]
+        collection = coll_dict.pop("collection")
+
+        # cast each object in the JSON list to a CollectionImage. This
+        # is done in place so that each dict can be freed as soon as it
+        # is converted, instead of keeping the parsed list and a new
+        # list of images in memory at the same time.
+        for idx, item in enumerate(collection):
+            collection[idx] = CollectionImage.from_dict(item)
 
         return Collection(path, version, collection)
 
 
     @classmethod
-    def __check_files(cls, collection):
+    def __check_files(cls, collection, dir_entries=None):
         """ Summary
             -------
             Runs through the files in the work directory and adds any
             image that is not yet in our collection. Removes any image
             whose file no longer exists -> data loss on renaming a file
 
+            Arguments
+            ---------
+            collection : Collection
+                the collection to check
+            dir_entries : list(os.DirEntry), optional
+                listing of the work directory, if the caller already
+                has one. Otherwise the directory is listed here.
+
             Returns
             -------
             checked_collection : Collection
@@ -232,80 +289,202 @@ class CollectionManager():
                 will be added to the collection, and the updated
                 collection is returned)
         """
-        # type safety check
-        if not isinstance(collection, Collection):
-            raise TypeError("collection must be of type Collection, not %s"
-                % type(collection)
-            )
+        # type safety check, only called from load() so this is
+        # stripped in optimized mode (python -O)
+        assert isinstance(collection, Collection), \
+            "collection must be of type Collection, not %s" % type(collection)
 
-        dir_contents = os.listdir(collection.work_directory)
+        if dir_entries is None:
+            with os.scandir(collection.work_directory) as scan:
+                dir_entries = list(scan)
 
         # filter the collection list to remove from the collection
         # references to files that no longer exist
-        collection.collection = [i for i in collection.collection if i.filename in dir_contents]
+        existing_files = {entry.name for entry in dir_entries}
+        collection.collection = [i for i in collection.collection if i.filename in existing_files]
+
+        # filenames already in the collection, so we don't have to
+        # compare each file against every image of the collection
+        known_files = {i.filename for i in collection.collection}
+
+        for entry in dir_entries:
+            # DirEntry caches the file type, this doesn't cost a stat
+            # call on most platforms
+            if not entry.is_file():
+                continue
+
+            filename = entry.name
 
-        for filename in dir_contents:
             # reject all files with the wrong extension (case
             # insensitive)
-            if filename.lower().endswith(CollectionUtils.AUTHORIZED_IMAGE_FORMATS):
-                new_image = CollectionImage(filename)
-
-                # this works since we overloaded the equal operator in
-                # CollectionImage !
-                if new_image not in collection.collection:
+            if os.path.splitext(filename)[1].lower() in AUTHORIZED_IMAGE_FORMATS:
+                if filename not in known_files:
                     # add the new image
-                    collection.collection.append(new_image)
+                    collection.collection.append(CollectionImage(filename))
+                    known_files.add(filename)
 
         return collection
 
 
     @classmethod
-    def __write_meta(cls, collection):
+    def __write_meta(cls, collection, meta_filename=None, in_sync=False):
         """ Serializes this collection and saves it in the project meta
-            file in the work directory
+            file in the work directory. If meta_filename is not given,
+            it is looked up in the work directory. in_sync must only be
+            set if the collection was just checked against the files of
+            the directory (see __check_files), or if nothing changed in
+            the directory since it was (see __is_in_sync).
+            Returns the path to the meta file.
         """
-        # type safety check
-        if not isinstance(collection, Collection):
-            raise TypeError(
-                "collection must be of type Collection, not %s"
-                % type(collection)
-            )
+        # type safety check, stripped in optimized mode (python -O)
+        assert isinstance(collection, Collection), \
+            "collection must be of type Collection, not %s" % type(collection)
 
-        meta_file_path = os.path.join(
-            collection.work_directory,
-            cls._get_meta_filename(collection.work_directory)
-        )
+        if not meta_filename:
+            meta_filename = cls._get_meta_filename(collection.work_directory)
+
+        meta_file_path = os.path.join(collection.work_directory, meta_filename)
 
-        # create metadata file in the project directory
-        with open(meta_file_path, "w") as meta_file:
-            # convert the collection to JSON
-            json_data = json.loads(collection.to_json())
-            # convert to string and minify JSON file
-            #formatted_json = json.dumps(json_data, separators=(',', ':'))
-            #prettified
-            formatted_json = json.dumps(json_data, indent=4)
+        # convert the collection to minified JSON in a single pass,
+        # using the encoder generated by mashumaro
+        formatted_json = collection.to_jsonb()
 
-            if not formatted_json.strip():
-                # prevent data from being erased
-                raise RuntimeError("Tried to write an empty Collection")
+        if not formatted_json.strip():
+            # prevent data from being erased
+            raise RuntimeError("Tried to write an empty Collection")
 
+        # write to a temporary file first and swap it with the meta
+        # file, so that a crash while writing can't corrupt it
+        tmp_file_path = meta_file_path + ".tmp"
+
+        with open(tmp_file_path, "wb") as meta_file:
             meta_file.write(formatted_json)
+            meta_file.flush()
+            os.fsync(meta_file.fileno())
+
+        os.replace(tmp_file_path, meta_file_path)
+
+        # stamp the meta file with the modification time of the
+        # directory (which the replace above just updated), so that
+        # load() can tell if the directory changed since then. If the
+        # collection isn't in sync, files may have been added or
+        # removed since the collection was loaded: the meta is stamped
+        # 1ns before the directory instead, which can never match, so
+        # that the next load() checks the files again.
+        #
+        # NOTE: this relies on the directory mtime being updated on
+        # every change, with a fine resolution. HFS+ (1s) and FAT/exFAT
+        # (2s) only store whole seconds, so a change made in the same
+        # second as this write would go unnoticed: the shortcut is
+        # disabled when the mtime has no sub-second part. Filesystems
+        # that don't update directory mtimes at all (some network
+        # shares) can't be detected. A file added between the check
+        # and this write is missed as well.
+        dir_mtime = os.stat(collection.work_directory).st_mtime_ns
+
+        if in_sync and dir_mtime % 1_000_000_000:
+            meta_mtime = dir_mtime
+        else:
+            meta_mtime = dir_mtime - 1
+
+        os.utime(meta_file_path, ns=(meta_mtime, meta_mtime))
+
+        return meta_file_path
+
+
+    @classmethod
+    def __is_in_sync(cls, path, meta_filename):
+        """ Summary
+            -------
+            Checks if the meta file still matches the contents of the
+            work directory, that is if the directory hasn't been
+            modified since the meta file was written.
+
+            Returns
+            -------
+            bool
+                True if the directory wasn't modified since the meta
+                file was written
+        """
+        meta_mtime = os.stat(os.path.join(path, meta_filename)).st_mtime_ns
+
+        return os.stat(path).st_mtime_ns == meta_mtime
+
+
+    @classmethod
+    def __cache(cls, collection, meta_file_path):
+        """ Keeps a collection that is in sync with the files of its
+            directory in the cache, dropping the least recently used one
+            if the cache is full.
+        """
+        key = os.path.abspath(collection.work_directory)
+        meta_mtime = os.stat(meta_file_path).st_mtime_ns
+
+        cls._cache[key] = (meta_file_path, meta_mtime, collection)
+        cls._cache.move_to_end(key)
+
+        while len(cls._cache) > cls.CACHE_SIZE:
+            cls._cache.popitem(last=False)
+
+
+    @classmethod
+    def __get_cached(cls, path):
+        """ Summary
+            -------
+            Gets the cached collection of a work directory, if neither
+            its meta file nor the directory changed since it was cached.
+
+            Returns
+            -------
+            collection : Collection or None
+                the cached collection, None if there is none or if it
+                is outdated
+        """
+        key = os.path.abspath(path)
+        if key not in cls._cache:
+            return None
+
+        meta_file_path, meta_mtime, collection = cls._cache[key]
+
+        try:
+            # the meta file is stamped with the mtime of the directory
+            # when it is written (see __write_meta)
+            is_up_to_date = (
+                os.stat(meta_file_path).st_mtime_ns == meta_mtime and
+                os.stat(path).st_mtime_ns == meta_mtime
+            )
+        except OSError:
+            # the meta file or the directory no longer exists
+            is_up_to_date = False
+
+        if not is_up_to_date:
+            del cls._cache[key]
+            return None
+
+        cls._cache.move_to_end(key)
+        return collection
 
 
     @classmethod
     def __create_meta(cls, path):
+        """ Creates an empty meta file and returns its filename """
         # default filename is collection.arty
-        path = os.path.join(path, "collection" + cls.META_EXTENSION)
-        open(path, "a").close()
+        meta_filename = "collection" + cls.META_EXTENSION
+        open(os.path.join(path, meta_filename), "a").close()
+        return meta_filename
 
 
     @classmethod
-    def _get_meta_filename(cls, path):
+    def _get_meta_filename(cls, path, dir_contents=None):
         """
             Gets the first file with the correct extension. If none are
-            found, returns False
+            found, returns False. dir_contents can be given to reuse an
+            existing listing of the directory.
         """
-        for fname in os.listdir(path):
+        if dir_contents is None:
+            dir_contents = os.listdir(path)
+
+        for fname in dir_contents:
             if fname.endswith(cls.META_EXTENSION):
                 return fname
         # if no collection meta file is found
@@ -7,6 +7,14 @@ from unidecode import unidecode
 
 from api.CollectionImage import CollectionImage
 
+
+# lowercase extensions, as returned by os.path.splitext. Defined at
+# module level so that hot loops can import it directly.
+AUTHORIZED_IMAGE_FORMATS = frozenset((
+    ".jpg", ".jpeg", ".png", ".webp", ".tiff"
+))
+
+
 class CollectionUtils():
     """ Summary
         -------
@@ -37,9 +45,7 @@ class CollectionUtils():
             [b][/b]: bold
     """
 
-    AUTHORIZED_IMAGE_FORMATS = (
-        ".jpg", ".jpeg", ".png", ".webp", ".tiff"
-    )
+    AUTHORIZED_IMAGE_FORMATS = AUTHORIZED_IMAGE_FORMATS
 
     LEGEND_STYLES = {
         "SIMPLE": """
@@ -2,6 +2,8 @@ from kivy.uix.screenmanager import Screen
 from kivy.lang.builder import Builder
 
 from widgets.CollectionImageList import CollectionImageList
+from widgets.CollectionPanel import CollectionPanel
+from widgets.CollectionToolbar import CollectionToolbar
 
 class CollectionScreen(Screen):
     Builder.load_file("templates/CollectionScreen.kv")
\ No newline at end of file
@@ -8,6 +8,7 @@
 import unittest
 
 from tests.CollectionTests import TestCollectionImage, TestCollection
+from tests.CollectionManagerTests import TestCollectionManager
 
 if __name__ == '__main__':
     unittest.main()
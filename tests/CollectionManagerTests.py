@@ -0,0 +1,140 @@
+import unittest
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from api.CollectionManager import CollectionManager
+
+class TestCollectionManager(unittest.TestCase):
+
+    def setUp(self):
+        # work directory with two images and a file that isn't one
+        self.work_dir = tempfile.mkdtemp()
+        for filename in ("a.jpg", "B.PNG", "notes.txt"):
+            open(os.path.join(self.work_dir, filename), "wb").close()
+
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir)
+
+
+    def test_load(self):
+        collection = CollectionManager.load(self.work_dir)
+
+        self.assertEqual(
+            sorted(i.filename for i in collection.get_collection()),
+            ["B.PNG", "a.jpg"]
+        )
+        # a meta file has been created in the work directory
+        self.assertTrue(CollectionManager._get_meta_filename(self.work_dir))
+
+
+    def test_save(self):
+        collection = CollectionManager.load(self.work_dir)
+        for image in collection.get_collection():
+            image.title = "Title of %s" % image.filename
+
+        CollectionManager.save(collection)
+        # make sure the collection is read back from disk
+        CollectionManager._cache.clear()
+        loaded = CollectionManager.load(self.work_dir)
+
+        self.assertIsNot(loaded, collection)
+
+        self.assertEqual(
+            sorted((i.filename, i.title) for i in loaded.get_collection()),
+            [("B.PNG", "Title of B.PNG"), ("a.jpg", "Title of a.jpg")]
+        )
+        # the temporary file used to write the meta has been replaced
+        self.assertEqual(
+            sorted(os.listdir(self.work_dir)),
+            ["B.PNG", "a.jpg", "collection.arty", "notes.txt"]
+        )
+
+
+    def test_load_changes(self):
+        CollectionManager.load(self.work_dir)
+
+        # files added or removed after the collection was saved are
+        # picked up on the next load
+        open(os.path.join(self.work_dir, "c.jpeg"), "wb").close()
+        os.remove(os.path.join(self.work_dir, "a.jpg"))
+        loaded = CollectionManager.load(self.work_dir)
+
+        self.assertEqual(
+            sorted(i.filename for i in loaded.get_collection()),
+            ["B.PNG", "c.jpeg"]
+        )
+
+
+    def test_save_changes(self):
+        collection = CollectionManager.load(self.work_dir)
+
+        # files added or removed outside of the app are still picked up
+        # on the next load after the collection has been saved, since
+        # saving doesn't check the files
+        open(os.path.join(self.work_dir, "c.jpeg"), "wb").close()
+        os.remove(os.path.join(self.work_dir, "a.jpg"))
+        CollectionManager.save(collection)
+        CollectionManager._cache.clear()
+        loaded = CollectionManager.load(self.work_dir)
+
+        self.assertEqual(
+            sorted(i.filename for i in loaded.get_collection()),
+            ["B.PNG", "c.jpeg"]
+        )
+
+
+    def test_save_unchanged(self):
+        collection = CollectionManager.load(self.work_dir)
+
+        # if nothing changed in the directory, saving keeps the meta in
+        # sync and the next load doesn't check the files again
+        CollectionManager.save(collection)
+        CollectionManager._cache.clear()
+
+        with mock.patch.object(
+            CollectionManager, "_CollectionManager__check_files"
+        ) as check_files:
+            loaded = CollectionManager.load(self.work_dir)
+
+        check_files.assert_not_called()
+        self.assertEqual(
+            sorted(i.filename for i in loaded.get_collection()),
+            ["B.PNG", "a.jpg"]
+        )
+
+
+    def test_load_cached(self):
+        collection = CollectionManager.load(self.work_dir)
+
+        # the collection is kept in memory as long as nothing changes
+        # on disk
+        self.assertIs(CollectionManager.load(self.work_dir), collection)
+
+        open(os.path.join(self.work_dir, "c.jpeg"), "wb").close()
+        reloaded = CollectionManager.load(self.work_dir)
+        self.assertIsNot(reloaded, collection)
+
+        collection = reloaded
+        self.assertEqual(
+            sorted(i.filename for i in collection.get_collection()),
+            ["B.PNG", "a.jpg", "c.jpeg"]
+        )
+
+        # the saved collection stays cached if nothing changed on disk
+        CollectionManager.save(collection)
+        self.assertIs(CollectionManager.load(self.work_dir), collection)
+
+        # saving doesn't check the files, so a change made outside of
+        # the app before the save is picked up on the next load
+        os.remove(os.path.join(self.work_dir, "a.jpg"))
+        CollectionManager.save(collection)
+        loaded = CollectionManager.load(self.work_dir)
+
+        self.assertIsNot(loaded, collection)
+        self.assertEqual(
+            sorted(i.filename for i in loaded.get_collection()),
+            ["B.PNG", "c.jpeg"]
+        )
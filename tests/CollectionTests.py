@@ -20,6 +20,18 @@ class TestCollectionImage(unittest.TestCase):
         self.assertNotEqual(img1, img2)
 
 
+    def test_hash(self):
+        img1 = CollectionImage(filename="1", title="A")
+        img2 = CollectionImage(filename="2")
+        img3 = CollectionImage(filename="1", title="B")
+
+        # images that are equal must hash the same, so that they can be
+        # used in sets and as dict keys
+        self.assertEqual(hash(img1), hash(img3))
+        self.assertEqual(len({img1, img2, img3}), 2)
+        self.assertIn(img3, {img1, img2})
+
+
     def test_to_legend(self):
         test_image1 = CollectionImage(
             filename ="48224.jpg",
@@ -41,6 +41,8 @@ class CollectionGridTile(SmartTileWithLabel, ButtonBehavior):
     collection_image = kyprops.ObjectProperty(None)
     is_hovered = False
 
+    app = None
+
     Builder.load_file("templates/CollectionGridTile.kv")
 
 
@@ -51,6 +53,7 @@ class CollectionGridTile(SmartTileWithLabel, ButtonBehavior):
         # note: had to do it in the init, otherwise it doesn't work
         Window.bind(mouse_pos=self.on_mouse_pos)
         self.text = self.collection_image.to_legend(style_name="SIMPLE")
+        self.app = App.get_running_app()
 
 
     def on_press(self):
@@ -58,8 +61,7 @@ class CollectionGridTile(SmartTileWithLabel, ButtonBehavior):
             -------
             Displays this image in the CollectionPanel when clicked on
         """
-        app = App.get_running_app()
-        app.PANEL.set_image(self.collection_image)
+        self.app.PANEL.set_image(self.collection_image)
 
 
     def checkbox_click(self, _instance, is_checked):
@@ -75,16 +77,16 @@ class CollectionGridTile(SmartTileWithLabel, ButtonBehavior):
                 states if the checkbox is checked
         """
 
-        app = App.get_running_app()
+        selected_images = self.app.TOOLBAR.selected_images
 
         # appends the image to the selection
         if is_checked:
-            if self.collection_image not in app.TOOLBAR.selected_images:
-                app.TOOLBAR.selected_images.append(self.collection_image)
+            if self.collection_image not in selected_images:
+                selected_images.append(self.collection_image)
         # removes the image from the selection
         else:
-            if self.collection_image in app.TOOLBAR.selected_images:
-                app.TOOLBAR.selected_images.remove(self.collection_image)
+            if self.collection_image in selected_images:
+                selected_images.remove(self.collection_image)
 
 
     def on_mouse_pos(self, _window, pos):
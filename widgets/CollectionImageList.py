@@ -22,6 +22,9 @@ class CollectionImageList(MDGridLayout):
         set_display_list(collection_list)
             Displays a list of CollectionImages in the order of the
             list. set_collection() must have been called prior.
+        append_image(collection_image)
+            Adds a single image at the end of the grid.
+            set_collection() must have been called prior.
     """
     CURRENT_COLLECTION = None
     display_list = list()
@@ -77,28 +80,54 @@ class CollectionImageList(MDGridLayout):
             self.clear_widgets()
 
         for collection_image in collection_list:
-            # get absolute path to the image, in order to display it
-            absolute_path = self.CURRENT_COLLECTION.get_absolute_path(
-                collection_image
-            )
+            self._add_tile(collection_image)
 
-            try:
-                # create an image widget
-                tile = CollectionGridTile(
-                    source=absolute_path,
-                    collection_image=collection_image
-                )
+        self.display_list = collection_list
 
-                # add it to the grid
-                self.add_widget(tile)
 
-            except ValueError:
-                Logger.exception(
-                    'CollectionGrid: Unable to load <%s>' % collection_image
-                )
-                App.get_running_app().show_error("Unable to load <%s>" % collection_image)
+    def append_image(self, collection_image):
+        """ Summary
+            -------
+            Adds a single image at the end of the grid, without
+            rebuilding the tiles of the images already displayed.
+            A collection must have been set using the set_collection()
+            method.
 
-        self.display_list = collection_list
+            Arguments
+            ---------
+            collection_image : CollectionImage
+                The image to add to the grid.
+        """
+        self._add_tile(collection_image)
+
+        # the display list may be the collection list itself, in which
+        # case the image is already in it
+        if collection_image not in self.display_list:
+            self.display_list = self.display_list + [collection_image]
+
+
+    def _add_tile(self, collection_image):
+        """ Creates the tile of an image and adds it to the grid """
+        # get absolute path to the image, in order to display it
+        absolute_path = self.CURRENT_COLLECTION.get_absolute_path(
+            collection_image
+        )
+
+        try:
+            # create an image widget
+            tile = CollectionGridTile(
+                source=absolute_path,
+                collection_image=collection_image
+            )
+
+            # add it to the grid
+            self.add_widget(tile)
+
+        except ValueError:
+            Logger.exception(
+                'CollectionGrid: Unable to load <%s>' % collection_image
+            )
+            App.get_running_app().show_error("Unable to load <%s>" % collection_image)
 
 
     def update_image(self, collection_image):
@@ -66,7 +66,9 @@ class CollectionToolbar(BoxLayout):
             on_press filter button, opens the filter window
 
     """
-    Builder.load_file('templates/CollectionToolbar.kv')
+    # the template is loaded on first instantiation rather than when
+    # this module is imported
+    _kv_loaded = False
 
     app = None
 
@@ -77,6 +79,12 @@ class CollectionToolbar(BoxLayout):
     # dialog is active
 
     dialog = None
+
+    # the filter and export dialogs are built on first use, then kept
+    # and reopened (this also keeps the filters between two openings)
+    filter_dialog = None
+    export_dialog = None
+
     # NOT WORKING
     # toolbar_icon = kyprops.ListProperty([
     #     ["sort-ascending", lambda x: open_filter(), 'Sort the collection'],
@@ -89,6 +97,12 @@ class CollectionToolbar(BoxLayout):
     # )
 
     def __init__(self, **kwargs):
+        # the rules must be loaded before the widget is initialized,
+        # since that's when they are applied
+        if not CollectionToolbar._kv_loaded:
+            Builder.load_file('templates/CollectionToolbar.kv')
+            CollectionToolbar._kv_loaded = True
+
         super(CollectionToolbar, self).__init__(**kwargs)
         self.app = App.get_running_app()
     
@@ -150,7 +164,7 @@ class CollectionToolbar(BoxLayout):
         collection = self.app.CURRENT_COLLECTION
 
         # saves curent collection
-        CollectionManager().save(collection)
+        CollectionManager.save(collection)
         ConfirmationSnackbar().open()
 
 
@@ -184,9 +198,10 @@ class CollectionToolbar(BoxLayout):
         # get selected images
         # send them to the compare screen
         try:
-            self.app.SCREENS["COMPARE"].load_images(self.selected_images)
+            comparison_screen = self.app.get_screen("COMPARE")
+            comparison_screen.load_images(self.selected_images)
             self.app.SCREEN_MANAGER.switch_to(
-                self.app.SCREENS["COMPARE"],
+                comparison_screen,
                 direction ='left')
         except ValueError:
             #show popup if the wrong amount of images is selected
@@ -226,8 +241,8 @@ class CollectionToolbar(BoxLayout):
             Opens the filter window with the current filters
         """
 
-        if not self.dialog:
-            self.dialog = MDDialog(
+        if not self.filter_dialog:
+            self.filter_dialog = MDDialog(
                 title="Filter",
                 type="custom",
                 content_cls=FilterDialogContent(),
@@ -247,6 +262,7 @@ class CollectionToolbar(BoxLayout):
                 ],
             )
 
+        self.dialog = self.filter_dialog
         self.dialog.open()
 
 
@@ -329,8 +345,8 @@ class CollectionToolbar(BoxLayout):
             self.app.show_error("Please select at least one image")
             return
 
-        if not self.dialog:
-            self.dialog = MDDialog(
+        if not self.export_dialog:
+            self.export_dialog = MDDialog(
                 title="Export",
                 type="custom",
                 content_cls=ExportDialogContent(),
@@ -346,6 +362,7 @@ class CollectionToolbar(BoxLayout):
                 ],
             )
 
+        self.dialog = self.export_dialog
         self.dialog.open()
 
 